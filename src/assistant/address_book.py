@@ -1,56 +1,58 @@
-from assistant.models import Record, Field, AddressBook
-from assistant.handlers import input_error
+from assistant.models import Address, AddressBook
+from assistant.handlers import MISSING_ARGS, CONTACT_NOT_FOUND
 
 
-class Address(Field):
-    """Клас для зберігання адреси (рядок без валідації)."""
-    def __init__(self, value: str):
-        super().__init__(value)
-
-
-@input_error
 def add_address(args: list[str], book: AddressBook) -> str:
     """Додає адресу до контакту."""
+    if len(args) < 2:
+        return MISSING_ARGS
     name, address_str, *_ = args
     record = book.find(name)
     if not record:
-        raise KeyError
-    if not hasattr(record, "addresses"):
-        record.addresses = []
-    record.addresses.append(Address(address_str))
+        return CONTACT_NOT_FOUND
+    if address_str in record.addresses:
+        return "Address already exists."
+    record.addresses[address_str] = Address(address_str)
     return "Address added."
 
 
-@input_error
 def change_address(args: list[str], book: AddressBook) -> str:
     """Редагує адресу контакту за старим значенням."""
+    if len(args) < 3:
+        return MISSING_ARGS
     name, old_address, new_address, *_ = args
     record = book.find(name)
-    if not record or not hasattr(record, "addresses"):
-        raise KeyError
-    for addr in record.addresses:
-        if addr.value == old_address:
-            addr.value = new_address
-            return "Address updated."
-    return "Old address not found."
+    if not record:
+        return CONTACT_NOT_FOUND
+    addr = record.addresses.get(old_address)
+    if addr is None:
+        return "Old address not found."
+    if new_address != old_address and new_address in record.addresses:
+        return "Address already exists."
+    del record.addresses[old_address]
+    addr.value = new_address
+    record.addresses[new_address] = addr
+    return "Address updated."
 
 
-@input_error
 def show_address(args: list[str], book: AddressBook) -> str:
     """Показує всі адреси контакту."""
-    name = args[0]
-    record = book.find(name)
-    if not record or not hasattr(record, "addresses"):
-        raise KeyError
-    return "; ".join(addr.value for addr in record.addresses) or "No addresses."
+    if not args:
+        return MISSING_ARGS
+    record = book.find(args[0])
+    if not record:
+        return CONTACT_NOT_FOUND
+    addresses = record.addresses.values()
+    return "; ".join(addr.value for addr in addresses) or "No addresses."
 
 
-@input_error
 def remove_address(args: list[str], book: AddressBook) -> str:
     """Видаляє адресу контакту за значенням."""
+    if len(args) < 2:
+        return MISSING_ARGS
     name, address_str, *_ = args
     record = book.find(name)
-    if not record or not hasattr(record, "addresses"):
-        raise KeyError
-    record.addresses = [addr for addr in record.addresses if addr.value != address_str]
-    return "Address removed."
\ No newline at end of file
+    if not record:
+        return CONTACT_NOT_FOUND
+    record.addresses.pop(address_str, None)
+    return "Address removed."
@@ -1,3 +1,5 @@
+import sys
+
 from .models import AddressBook, Record
 from .storage import load_data, save_data
 from .handlers import (
@@ -12,39 +14,58 @@ from .handlers import (
     remove_contact,
 )
 
+# Команди з аргументами: ім'я команди -> обробник(args, book)
+_ARG_CMDS = {
+    "add": add_contact,
+    "remove-contact": remove_contact,
+    "delete-contact": remove_contact,
+    "change": change_contact,
+    "phone": show_phone,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+}
+# Команди без аргументів: ім'я команди -> обробник(book)
+_NO_ARG_CMDS = {
+    "hello": lambda book: "How can I help you?",
+    "all": show_all,
+    "birthdays": birthdays,
+}
+
+
+def read_commands():
+    """Повертає рядки команд: зі stdin пакетно або інтерактивно через input()."""
+    if not sys.stdin.isatty():
+        # Вхід перенаправлено (скрипт, тести) – буферизоване читання по рядках
+        yield from sys.stdin
+        return
+    try:
+        import readline  # noqa: F401  історія команд стрілками вгору/вниз
+    except ImportError:
+        pass
+    while True:
+        try:
+            yield input("Enter a command: ")
+        except EOFError:
+            return
+
 
 def main():
     # Завантажуэмо AddressBook з файлу
     book = load_data()
     print("Welcome to the assistant bot!")
-    while True:
-        user_input = input("Enter a command: ")
+    for user_input in read_commands():
         command, args = parse_input(user_input)
-        if command in ("close", "exit"):
-            # Перед виходом зберігаємо AddressBook у файл
-            save_data(book)
-            print("Data saved. Good bye!")
+        if handler := _ARG_CMDS.get(command):
+            print(handler(args, book))
+        elif handler := _NO_ARG_CMDS.get(command):
+            print(handler(book))
+        elif command in ("close", "exit"):
             break
-        elif command == "hello":
-            print("How can I help you?")
-        elif command == "add":
-            print(add_contact(args, book))
-        elif command in ("remove-contact", "delete-contact"):
-            print(remove_contact(args, book))
-        elif command == "change":
-            print(change_contact(args, book))
-        elif command == "phone":
-            print(show_phone(args, book))
-        elif command == "all":
-            print(show_all(book))
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-        elif command == "birthdays":
-            print(birthdays(book))
         else:
             print("Invalid command.")
+    # Перед виходом (команда або кінець вводу) зберігаємо AddressBook у файл
+    save_data(book)
+    print("Data saved. Good bye!")
 
 
 if __name__ == "__main__":
@@ -1,22 +1,7 @@
-from functools import wraps
 from assistant.models import AddressBook, Record
 
-
-def input_error(func):
-    """Декоратор для обробки помилок вводу користувача."""
-
-    @wraps(func)
-    def inner(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except KeyError:
-            return "Contact not found."
-        except ValueError as e:
-            return str(e)
-        except IndexError:
-            return "Enter the command followed by necessary arguments."
-
-    return inner
+MISSING_ARGS = "Enter the command followed by necessary arguments."
+CONTACT_NOT_FOUND = "Contact not found."
 
 
 def parse_input(user_input: str) -> tuple[str, list[str]]:
@@ -28,9 +13,10 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
     return cmd, parts[1:]
 
 
-@input_error
 def add_contact(args: list[str], book: AddressBook) -> str:
     """Додає або оновлює контакт у адресній книзі."""
+    if len(args) < 2:
+        return MISSING_ARGS
     name, phone, *_ = args
     record = book.find(name)
     if record is None:
@@ -40,30 +26,38 @@ def add_contact(args: list[str], book: AddressBook) -> str:
     else:
         message = "Contact updated."
     if phone:
-        record.add_phone(phone)
+        try:
+            record.add_phone(phone)
+        except ValueError as e:
+            return str(e)
     return message
 
 
-@input_error
 def change_contact(args: list[str], book: AddressBook) -> str:
     """Змінює номер телефону для вказаного контакту."""
+    if len(args) < 3:
+        return MISSING_ARGS
     name, old_phone, new_phone, *_ = args
     record = book.find(name)
     if not record:
-        raise KeyError
-    if record.edit_phone(old_phone, new_phone):
+        return CONTACT_NOT_FOUND
+    try:
+        updated = record.edit_phone(old_phone, new_phone)
+    except ValueError as e:
+        return str(e)
+    if updated:
         return "Phone updated."
     return "Old phone not found."
 
 
-@input_error
 def show_phone(args: list[str], book: AddressBook) -> str:
     """Показує телефонні номери для вказаного контакту."""
-    name = args[0]
-    record = book.find(name)
+    if not args:
+        return MISSING_ARGS
+    record = book.find(args[0])
     if not record:
-        raise KeyError
-    phones = "; ".join(p.phone_number for p in record.phones) or "No phones."
+        return CONTACT_NOT_FOUND
+    phones = "; ".join(record.phones) or "No phones."
     return phones
 
 
@@ -74,24 +68,28 @@ def show_all(book: AddressBook) -> str:
     return "\n".join(str(rec) for rec in book.data.values())
 
 
-@input_error
 def add_birthday(args: list[str], book: AddressBook) -> str:
     """Додає дату народження для вказаного контакту."""
+    if len(args) < 2:
+        return MISSING_ARGS
     name, bday_str, *_ = args
     record = book.find(name)
     if not record:
-        raise KeyError
-    record.add_birthday(bday_str)
+        return CONTACT_NOT_FOUND
+    try:
+        record.add_birthday(bday_str)
+    except ValueError as e:
+        return str(e)
     return "Birthday added."
 
 
-@input_error
 def show_birthday(args: list[str], book: AddressBook) -> str:
     """Показує дату народження для вказаного контакту."""
-    name = args[0]
-    record = book.find(name)
+    if not args:
+        return MISSING_ARGS
+    record = book.find(args[0])
     if not record:
-        raise KeyError
+        return CONTACT_NOT_FOUND
     if record.birthday:
         return record.birthday.date_str
     return "Birthday not set."
@@ -105,12 +103,13 @@ def birthdays(book: AddressBook) -> str:
     return "\n".join(upcoming)
 
 
-@input_error
 def remove_contact(args: list[str], book: AddressBook) -> str:
     """Видаляє контакт з адресної книги за їм'ям."""
+    if not args:
+        return MISSING_ARGS
     name = args[0]
     record = book.find(name)
     if not record:
-        raise KeyError
+        return CONTACT_NOT_FOUND
     book.delete(name)
     return f"Contact '{name}' has been removed."
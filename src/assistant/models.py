@@ -1,12 +1,15 @@
+from bisect import bisect_left, bisect_right, insort
+from calendar import isleap
 from collections import UserDict
-from datetime import datetime, timedelta
-from functools import wraps
-import pickle
+from datetime import date
+import sys
 
 
 class Field:
     """Базовий клас для всіх полів."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -17,84 +20,145 @@ class Field:
 class Name(Field):
     """Клас для зберігання імені контакту."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         if not value:
             raise ValueError("Invalid name.")
         super().__init__(value)
 
 
-class Phone(Field):
-    """Клас для зберігання номера телефону з валідацією (10 цифр)."""
+class Phone:
+    """Валідація номера телефону (10 цифр).
 
-    def __init__(self, value):
-        if not self._validate(value):
-            raise ValueError("Phone number must contain exactly 10 digits.")
-        super().__init__(value)
+    Record зберігає номери як рядки, Phone лише перевіряє їхній формат.
+    """
 
     @staticmethod
     def _validate(value: str) -> bool:
-        return value.isdigit() and len(value) == 10
-
-    @property
-    def phone_number(self) -> str:
-        return self.value
+        # Лише ASCII-цифри; довжину перевіряємо першою, щоб не сканувати зайве
+        return len(value) == 10 and value.isascii() and value.isdigit()
 
-    def update_number(self, new_number: str) -> None:
-        """Оновлює номер телефону з валідацією."""
-        if not self._validate(new_number):
+    @classmethod
+    def check(cls, value: str) -> None:
+        """Піднімає ValueError, якщо номер телефону некоректний."""
+        if not cls._validate(value):
             raise ValueError("Phone number must contain exactly 10 digits.")
-        self.value = new_number
 
 
 class Birthday(Field):
     """Клас для зберігання дати народження (формат DD.MM.YYYY)."""
 
+    __slots__ = ("_str",)
+
     def __init__(self, value: str):
         try:
-            # Перетворити рядок на datetime та зберегти у value
-            dt = datetime.strptime(value, "%d.%m.%Y")
-            super().__init__(dt.date())
+            # Формат фіксований, тож розбираємо рядок вручну замість strptime
+            day, month, year = value.split(".")
+            digits = day + month + year
+            if not (
+                0 < len(day) <= 2
+                and 0 < len(month) <= 2
+                and len(year) == 4
+                and digits.isascii()
+                and digits.isdigit()
+            ):
+                raise ValueError
+            bday = date(int(year), int(month), int(day))
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        super().__init__(bday)
+        # Дата незмінна, тож рядкове представлення обчислюємо один раз
+        self._str = f"{bday.day:02d}.{bday.month:02d}.{bday.year:04d}"
 
     @property
     def date_str(self) -> str:
         """Повертає дату у вихідному форматі."""
-        return self.value.strftime("%d.%m.%Y")
+        return self._str
+
+
+class Address(Field):
+    """Клас для зберігання адреси (рядок без валідації)."""
+
+    __slots__ = ()
+
+    def __init__(self, value: str):
+        super().__init__(value)
 
 
 class Record:
     """Клас для зберігання інформації про контакт."""
 
+    __slots__ = (
+        "name",
+        "phones",
+        "_book",
+        "_birthday",
+        "addresses",
+        "_phone_index",
+        "_phones_str",
+    )
+
     def __init__(self, name: str):
         self.name = Name(name)
-        self.phones: list[Phone] = []
-        self.birthday: Birthday | None = None
+        self.phones: list[str] = []
+        # Книга, до якої додано запис; через неї оновлюється індекс днів народження
+        self._book: AddressBook | None = None
+        self._birthday: Birthday | None = None
+        # Адреси за значенням: dict зберігає порядок і дає пошук за O(1)
+        self.addresses: dict[str, Address] = {}
+        # Множина номерів для перевірки наявності за O(1); список зберігає порядок
+        self._phone_index: set[str] = set()
+        # Кеш рядка телефонів для __str__; скидається при кожній зміні номерів
+        self._phones_str: str | None = None
 
     def add_phone(self, phone_number: str) -> None:
         """Додає номер телефону до запису."""
-        self.phones.append(Phone(phone_number))
+        Phone.check(phone_number)
+        if phone_number in self._phone_index:
+            raise ValueError("Phone already exists.")
+        self._phone_index.add(phone_number)
+        self.phones.append(phone_number)
+        self._phones_str = None
 
     def remove_phone(self, phone_number: str) -> None:
         """Видаляє номер телефону з запису."""
-        phone = self.find_phone(phone_number)
-        if phone:
-            self.phones.remove(phone)
+        if phone_number in self._phone_index:
+            self._phone_index.remove(phone_number)
+            self.phones.remove(phone_number)
+            self._phones_str = None
 
     def edit_phone(self, old_number: str, new_number: str) -> bool:
         """Редагує номер телефону в записі."""
-        phone = self.find_phone(old_number)
-        if phone:
-            phone.update_number(new_number)
-            return True
-        return False
-
-    def find_phone(self, phone_number: str) -> Phone | None:
+        if old_number not in self._phone_index:
+            return False
+        Phone.check(new_number)
+        if new_number != old_number and new_number in self._phone_index:
+            raise ValueError("Phone already exists.")
+        self._phone_index.remove(old_number)
+        self._phone_index.add(new_number)
+        self.phones[self.phones.index(old_number)] = new_number
+        self._phones_str = None
+        return True
+
+    def find_phone(self, phone_number: str) -> str | None:
         """Знаходить номер телефону в записі."""
-        for ph in self.phones:
-            if ph.phone_number == phone_number:
-                return ph
-        return None
+        return phone_number if phone_number in self._phone_index else None
+
+    @property
+    def birthday(self) -> Birthday | None:
+        """Повертає день народження контакту."""
+        return self._birthday
+
+    @birthday.setter
+    def birthday(self, value: Birthday | None) -> None:
+        """Встановлює день народження та оновлює індекс книги запису."""
+        book = self._book
+        if book is not None and self._birthday is not None:
+            book._unindex_birthday(self)
+        self._birthday = value
+        if book is not None and value is not None:
+            book._index_birthday(self)
 
     def add_birthday(self, birthday_str: str) -> None:
         """Додає день народження до контакту."""
@@ -103,48 +167,157 @@ class Record:
         self.birthday = Birthday(birthday_str)
 
     def __str__(self) -> str:
-        phones_str = "; ".join(p.phone_number for p in self.phones) or "No phones"
+        phones_str = self._phones_str
+        if phones_str is None:
+            phones_str = self._phones_str = "; ".join(self.phones) or "No phones"
         bday = self.birthday.date_str if self.birthday else "N/A"
         return (
             f"Contact name: {self.name.value}, phones: {phones_str}, birthday: {bday}"
         )
 
 
+# Скільки днів додати, щоб перенести дату з вихідних на понеділок (Пн..Нд)
+_WEEKEND_SHIFT = (0, 0, 0, 0, 0, 2, 1)
+
+
+def _bday_key(record: Record) -> tuple[int, int]:
+    """Ключ сортування індексу днів народження: (місяць, день)."""
+    birthday = record.birthday
+    assert birthday is not None  # в індексі лише записи з днем народження
+    return birthday.value.month, birthday.value.day
+
+
 class AddressBook(UserDict):
     """Клас для зберігання та управління колекцією записів."""
 
+    def __init__(self, *args, **kwargs):
+        # Записи з днями народження, відсортовані за (місяць, день)
+        self._bday_index: list[Record] = []
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, name: str, record: Record) -> None:
+        # Інтернуємо ім'я, щоб наступні пошуки порівнювали ключі за вказівником
+        name = sys.intern(name)
+        old = self.data.get(name)
+        if record._book is not None and old is not record:
+            raise ValueError("Record already belongs to an address book.")
+        if old is not None:
+            self._detach(old)
+        self.data[name] = record
+        record._book = self
+        if record.birthday:
+            self._index_birthday(record)
+
+    def __delitem__(self, name: str) -> None:
+        self._detach(self.data.pop(name))
+
+    def copy(self) -> "AddressBook":
+        """Повертає незалежну копію книги з власними записами та індексом.
+
+        Запис належить лише одній книзі, тож записи теж копіюються.
+        """
+        return type(self).from_dict(self.to_dict())
+
+    __copy__ = copy
+
     def add_record(self, record: Record) -> None:
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    def _detach(self, record: Record) -> None:
+        """Відв'язує запис від книги та прибирає його з індексу днів народження."""
+        if record.birthday:
+            self._unindex_birthday(record)
+        record._book = None
+
+    def _index_birthday(self, record: Record) -> None:
+        """Додає запис до індексу днів народження."""
+        insort(self._bday_index, record, key=_bday_key)
+
+    def _unindex_birthday(self, record: Record) -> None:
+        """Прибирає запис з індексу днів народження."""
+        index = self._bday_index
+        key = _bday_key(record)
+        for i in range(
+            bisect_left(index, key, key=_bday_key),
+            bisect_right(index, key, key=_bday_key),
+        ):
+            if index[i] is record:
+                del index[i]
+                return
+
+    def to_dict(self) -> dict:
+        """Перетворює адресну книгу на словник простих типів для серіалізації."""
+        return {
+            name: {
+                "phones": list(rec.phones),
+                "birthday": rec.birthday.date_str if rec.birthday else None,
+                "addresses": [a.value for a in rec.addresses.values()],
+            }
+            for name, rec in self.data.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AddressBook":
+        """Відновлює адресну книгу зі словника, створеного to_dict()."""
+        book = cls()
+        for name, fields in data.items():
+            record = Record(name)
+            # dict.fromkeys прибирає дублікати з відредагованих вручну файлів
+            for phone in dict.fromkeys(fields.get("phones", [])):
+                record.add_phone(phone)
+            if fields.get("birthday"):
+                record.add_birthday(fields["birthday"])
+            for address in fields.get("addresses", []):
+                record.addresses[address] = Address(address)
+            book.add_record(record)
+        return book
 
     def find(self, name: str) -> Record | None:
         """Знаходить запис за ім'ям."""
-        return self.data.get(name)
+        return self.data.get(sys.intern(name))
 
     def delete(self, name: str) -> None:
         """Видаляє запис за ім'ям."""
-        if name in self.data:
-            del self.data[name]
+        try:
+            del self[name]
+        except KeyError:
+            pass
 
     def get_upcoming_birthdays(self) -> list[str]:
         """Повертає список вітальних повідомлень на наступний тиждень."""
-        today = datetime.now().date()
-        next_week = today + timedelta(days=7)
+        today = date.today()
+        today_ordinal = today.toordinal()
+        # (місяць, день) -> порядковий номер дати для кожного дня від сьогодні до +7
+        window: dict[tuple[int, int], int] = {}
+        for day_ordinal in range(today_ordinal, today_ordinal + 8):
+            day = date.fromordinal(day_ordinal)
+            window[(day.month, day.day)] = day_ordinal
+        start = next(iter(window))
+        end = next(reversed(window))
+        index = self._bday_index
+        if start == (3, 1) and not isleap(today.year):
+            # 29 лютого у невисокосний рік вітаємо 1 березня – захоплюємо й ці записи
+            lo = bisect_left(index, (2, 29), key=_bday_key)
+        else:
+            lo = bisect_left(index, start, key=_bday_key)
+        hi = bisect_right(index, end, key=_bday_key)
+        if start <= end:
+            upcoming = index[lo:hi]
+        else:
+            # тиждень переходить через Новий рік – беремо кінець і початок індексу
+            upcoming = index[lo:] + index[:hi]
         greetings = []
-        for rec in self.data.values():
-            if rec.birthday:
-                # оновити рік на поточний
-                bday_this_year = rec.birthday.value.replace(year=today.year)
-                # якщо вже пройшов у цьому році – брати наступний рік
-                if bday_this_year < today:
-                    bday_this_year = bday_this_year.replace(year=today.year + 1)
-                if today <= bday_this_year <= next_week:
-                    # якщо день народження припадає на вихідні – переносимо на наступний понеділок
-                    congr_date = bday_this_year
-                    if congr_date.weekday() >= 5:  # 5 = субота, 6 = неділя
-                        congr_date = congr_date + timedelta(
-                            days=(7 - congr_date.weekday())
-                        )
-                    greetings.append(
-                        f"{congr_date.strftime('%Y-%m-%d')}: {rec.name.value}"
-                    )
+        for rec in upcoming:
+            bday_ordinal = window.get(_bday_key(rec))
+            if bday_ordinal is None:
+                # 29 лютого у невисокосний рік – вітаємо 1 березня, якщо воно у вікні
+                bday_ordinal = window.get((3, 1))
+                if bday_ordinal is None:
+                    continue
+            # date.fromordinal(1) – понеділок, тож (ordinal - 1) % 7 дає індекс Пн..Нд
+            # якщо день народження припадає на вихідні – переносимо на наступний понеділок
+            bday_ordinal += _WEEKEND_SHIFT[(bday_ordinal - 1) % 7]
+            greetings.append(
+                f"{date.fromordinal(bday_ordinal).isoformat()}: {rec.name.value}"
+            )
         return greetings
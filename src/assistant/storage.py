@@ -1,19 +1,65 @@
-import pickle
+import json
+import os
 from .models import AddressBook
 
-DEFAULT_DB = "addressbook.pkl"
+DEFAULT_DB = "addressbook.json"
+# Розмір буфера файлового вводу/виводу (1 MiB)
+BUFFER_SIZE = 1 << 20
+# Модулі, класи яких зустрічаються у старих pickle-файлах адресної книги
+_LEGACY_MODULES = ("assistant.models", "assistant.address_book")
 
 
-def save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
-    """Серіалізація адресної книги у файл за допомогою pickle."""
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+def save_data(book: AddressBook, filename: str = DEFAULT_DB) -> None:
+    """Серіалізація адресної книги у JSON-файл."""
+    with open(filename, "w", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+        json.dump(book.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
 
 
-def load_data(filename: str = "addressbook.pkl") -> AddressBook:
-    """Десеріалізація адресної книги з файлу, або створення нової, якщо файл відсутній."""
+def load_data(filename: str = DEFAULT_DB) -> AddressBook:
+    """Десеріалізація адресної книги з JSON-файлу.
+
+    Якщо JSON-файлу ще немає, але поруч лежить старий файл .pkl, книга
+    переноситься з нього; інакше створюється нова.
+    """
     try:
-        with open(filename, "rb") as f:
-            return pickle.load(f)
+        with open(filename, "r", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+            return AddressBook.from_dict(json.load(f))
     except FileNotFoundError:
+        legacy = os.path.splitext(filename)[0] + ".pkl"
+        if os.path.exists(legacy):
+            return load_legacy_data(legacy)
         return AddressBook()
+
+
+class _LegacyObject:
+    """Заглушка для об'єктів зі старого pickle-файлу: лише зберігає атрибути."""
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
+def load_legacy_data(filename: str) -> AddressBook:
+    """Переносить адресну книгу зі старого pickle-формату."""
+    import pickle
+
+    class LegacyUnpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            # Поточні класи мають інші атрибути, тож читаємо записи як заглушки
+            if module in _LEGACY_MODULES:
+                return _LegacyObject
+            # Окрім них стара книга містить лише дати; решту не завантажуємо
+            if (module, name) == ("datetime", "date"):
+                return super().find_class(module, name)
+            raise pickle.UnpicklingError(f"Forbidden global: {module}.{name}")
+
+    with open(filename, "rb", buffering=BUFFER_SIZE) as f:
+        legacy = LegacyUnpickler(f).load()
+    data = {}
+    for name, rec in legacy.data.items():
+        bday = rec.birthday.value.strftime("%d.%m.%Y") if rec.birthday else None
+        data[name] = {
+            "phones": [p.value for p in rec.phones],
+            "birthday": bday,
+            "addresses": [a.value for a in getattr(rec, "addresses", [])],
+        }
+    return AddressBook.from_dict(data)
@@ -0,0 +1,50 @@
+import unittest
+
+from assistant.address_book import (
+    add_address,
+    change_address,
+    remove_address,
+    show_address,
+)
+from assistant.handlers import CONTACT_NOT_FOUND, MISSING_ARGS
+from assistant.models import AddressBook, Record
+
+
+class AddressHandlersTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AddressBook()
+        self.book.add_record(Record("Ann"))
+
+    def test_add_change_remove(self):
+        self.assertEqual(show_address(["Ann"], self.book), "No addresses.")
+        self.assertEqual(add_address(["Ann", "Kyiv"], self.book), "Address added.")
+        self.assertEqual(add_address(["Ann", "Lviv"], self.book), "Address added.")
+        self.assertEqual(
+            change_address(["Ann", "Kyiv", "Odesa"], self.book), "Address updated."
+        )
+        self.assertEqual(
+            change_address(["Ann", "Kyiv", "Dnipro"], self.book),
+            "Old address not found.",
+        )
+        self.assertEqual(remove_address(["Ann", "Lviv"], self.book), "Address removed.")
+        self.assertEqual(show_address(["Ann"], self.book), "Odesa")
+
+    def test_duplicates_rejected(self):
+        add_address(["Ann", "Kyiv"], self.book)
+        add_address(["Ann", "Lviv"], self.book)
+        self.assertEqual(
+            add_address(["Ann", "Kyiv"], self.book), "Address already exists."
+        )
+        self.assertEqual(
+            change_address(["Ann", "Kyiv", "Lviv"], self.book),
+            "Address already exists.",
+        )
+        self.assertEqual(show_address(["Ann"], self.book), "Kyiv; Lviv")
+
+    def test_error_messages(self):
+        self.assertEqual(add_address(["Ann"], self.book), MISSING_ARGS)
+        self.assertEqual(show_address(["Bob"], self.book), CONTACT_NOT_FOUND)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from assistant import cli
+from assistant.handlers import CONTACT_NOT_FOUND, MISSING_ARGS
+from assistant.models import AddressBook
+
+
+class PipedInputTest(unittest.TestCase):
+    def run_main(self, commands: str) -> tuple[list[str], AddressBook, mock.Mock]:
+        book = AddressBook()
+        output = io.StringIO()
+        with (
+            mock.patch.object(cli, "load_data", return_value=book),
+            mock.patch.object(cli, "save_data") as save_data,
+            mock.patch("sys.stdin", io.StringIO(commands)),
+            redirect_stdout(output),
+        ):
+            cli.main()
+        return output.getvalue().splitlines(), book, save_data
+
+    def test_commands_without_exit_are_saved_at_end_of_input(self):
+        lines, book, save_data = self.run_main(
+            "add Ann 1234567890\nphone\nphone Bob\nphone Ann\n"
+        )
+        self.assertNotIn("Enter a command", "\n".join(lines))
+        self.assertEqual(
+            lines,
+            [
+                "Welcome to the assistant bot!",
+                "Contact added.",
+                MISSING_ARGS,
+                CONTACT_NOT_FOUND,
+                "1234567890",
+                "Data saved. Good bye!",
+            ],
+        )
+        save_data.assert_called_once_with(book)
+
+    def test_exit_stops_reading(self):
+        lines, book, save_data = self.run_main("exit\nadd Ann 1234567890\n")
+        self.assertEqual(lines, ["Welcome to the assistant bot!", "Data saved. Good bye!"])
+        self.assertEqual(len(book), 0)
+        save_data.assert_called_once_with(book)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import random
+import unittest
+from calendar import isleap
+from datetime import date, timedelta
+from unittest import mock
+
+from assistant import models
+from assistant.models import AddressBook, Birthday, Record
+
+
+class FakeDate(date):
+    """date з керованим today() для перевірки вікна днів народження."""
+
+    current = date(2026, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls(cls.current.year, cls.current.month, cls.current.day)
+
+
+def brute_force(book: AddressBook, today: date) -> list[str]:
+    """Еталон: перебирає всі записи та всі дні вікна без індексу."""
+    greetings = []
+    for rec in book.values():
+        if not rec.birthday:
+            continue
+        bday = rec.birthday.value
+        for offset in range(8):
+            day = today + timedelta(days=offset)
+            leap_shift = (bday.month, bday.day) == (2, 29) and not isleap(day.year)
+            if (bday.month, bday.day) == (day.month, day.day) or (
+                leap_shift and (day.month, day.day) == (3, 1)
+            ):
+                while day.weekday() >= 5:
+                    day += timedelta(days=1)
+                greetings.append(f"{day.isoformat()}: {rec.name.value}")
+    return sorted(greetings)
+
+
+class RecordPhonesTest(unittest.TestCase):
+    def test_duplicate_phone_rejected(self):
+        record = Record("A")
+        record.add_phone("1234567890")
+        with self.assertRaisesRegex(ValueError, "Phone already exists."):
+            record.add_phone("1234567890")
+        self.assertEqual(record.phones, ["1234567890"])
+
+    def test_non_ascii_digits_rejected(self):
+        record = Record("A")
+        with self.assertRaisesRegex(ValueError, "exactly 10 digits"):
+            record.add_phone("٠١٢٣٤٥٦٧٨٩")
+        self.assertEqual(record.phones, [])
+
+    def test_edit_to_existing_phone_rejected(self):
+        record = Record("A")
+        record.add_phone("1234567890")
+        record.add_phone("1111111111")
+        with self.assertRaisesRegex(ValueError, "Phone already exists."):
+            record.edit_phone("1234567890", "1111111111")
+        self.assertEqual(record.phones, ["1234567890", "1111111111"])
+        self.assertTrue(record.edit_phone("1234567890", "2222222222"))
+        self.assertEqual(record.phones, ["2222222222", "1111111111"])
+        self.assertIsNone(record.find_phone("1234567890"))
+        self.assertEqual(str(record).count("2222222222"), 1)
+
+
+class BirthdayTest(unittest.TestCase):
+    def test_accepted_formats(self):
+        self.assertEqual(Birthday("1.1.2000").value, date(2000, 1, 1))
+        self.assertEqual(Birthday("29.02.2000").value, date(2000, 2, 29))
+
+    def test_rejected_formats(self):
+        for value in [
+            "31.02.2000",
+            "29.02.2001",
+            "01/01/2000",
+            "01.01.200",
+            "1.1.0000",
+            "+1.01.2000",
+            "٠١.٠١.٢٠٠٠",
+        ]:
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "Use DD.MM.YYYY"):
+                    Birthday(value)
+
+    def test_date_str_is_zero_padded(self):
+        self.assertEqual(Birthday("1.2.0999").date_str, "01.02.0999")
+        self.assertEqual(Birthday("5.11.1990").date_str, "05.11.1990")
+
+
+class UpcomingBirthdaysTest(unittest.TestCase):
+    def assert_matches_brute_force(self, book: AddressBook, first: date, days: int):
+        with mock.patch.object(models, "date", FakeDate):
+            for offset in range(days):
+                today = first + timedelta(days=offset)
+                FakeDate.current = today
+                self.assertEqual(
+                    sorted(book.get_upcoming_birthdays()),
+                    brute_force(book, today),
+                    today,
+                )
+
+    def upcoming_on(self, book: AddressBook, today: date) -> list[str]:
+        with mock.patch.object(models, "date", FakeDate):
+            FakeDate.current = today
+            return book.get_upcoming_birthdays()
+
+    def test_index_follows_mapping_api(self):
+        rng = random.Random(0)
+        book = AddressBook()
+
+        def random_bday() -> str:
+            day = date(1990, 1, 1) + timedelta(days=rng.randrange(365))
+            return day.strftime("%d.%m.%Y")
+
+        for i in range(300):
+            record = Record(f"n{i}")
+            way = i % 4
+            if way == 0:
+                record.add_birthday(random_bday())
+                book.add_record(record)
+            elif way == 1:
+                book.add_record(record)
+                record.add_birthday(random_bday())
+            elif way == 2:
+                book[record.name.value] = record
+                record.add_birthday(random_bday())
+            else:
+                book.add_record(record)
+        # заміна записів з тим самим ім'ям
+        for i in range(0, 300, 10):
+            record = Record(f"n{i}")
+            record.add_birthday(random_bday())
+            book.add_record(record)
+        # видалення всіма способами
+        for i in range(1, 300, 9):
+            del book[f"n{i}"]
+        for i in range(2, 300, 11):
+            book.delete(f"n{i}")
+        for i in range(3, 300, 13):
+            book.pop(f"n{i}", None)
+        extra = Record("extra")
+        extra.add_birthday(random_bday())
+        book.update({"extra": extra})
+
+        self.assertEqual(
+            len(book._bday_index), sum(1 for rec in book.values() if rec.birthday)
+        )
+        # більше року, включно з переходом через Новий рік
+        self.assert_matches_brute_force(book, date(2025, 12, 1), 400)
+
+    def test_leap_day_birthday(self):
+        book = AddressBook()
+        birthdays = [("L", "29.02.2000"), ("F", "28.02.1990"), ("M", "01.03.1990")]
+        for name, bday in birthdays:
+            record = Record(name)
+            record.add_birthday(bday)
+            book.add_record(record)
+        # невисокосні та високосні роки, включно з 1 березня
+        self.assert_matches_brute_force(book, date(2023, 1, 1), 4 * 366)
+
+    def test_deleted_contact_not_greeted(self):
+        book = AddressBook()
+        record = Record("Z")
+        record.add_birthday("16.10.1990")
+        book.add_record(record)
+        del book["Z"]
+        self.assertEqual(self.upcoming_on(book, date(2026, 10, 15)), [])
+
+    def test_birthday_set_after_add_record(self):
+        book = AddressBook()
+        record = Record("A")
+        book.add_record(record)
+        record.add_birthday("16.10.1990")
+        self.assertEqual(self.upcoming_on(book, date(2026, 10, 15)), ["2026-10-16: A"])
+
+    def test_copy_has_own_index(self):
+        book = AddressBook()
+        record = Record("A")
+        record.add_birthday("16.10.1990")
+        book.add_record(record)
+        copied = book.copy()
+        late = Record("B")
+        late.add_birthday("17.10.1990")
+        copied.add_record(late)
+        self.assertEqual(self.upcoming_on(book, date(2026, 10, 15)), ["2026-10-16: A"])
+        self.assertEqual(
+            self.upcoming_on(copied, date(2026, 10, 15)),
+            ["2026-10-16: A", "2026-10-19: B"],
+        )
+
+    def test_record_cannot_join_two_books(self):
+        book = AddressBook()
+        record = Record("A")
+        book.add_record(record)
+        with self.assertRaises(ValueError):
+            AddressBook().add_record(record)
+        with self.assertRaises(ValueError):
+            book["alias"] = record
+
+
+if __name__ == "__main__":
+    unittest.main()
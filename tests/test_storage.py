@@ -0,0 +1,97 @@
+import os
+import pickle
+import tempfile
+import unittest
+from collections import UserDict
+from datetime import date
+from unittest import mock
+
+from assistant import models
+from assistant.storage import load_data, save_data
+
+
+class LegacyField:
+    def __init__(self, value):
+        self.value = value
+
+
+class LegacyRecord:
+    def __init__(self, name, phones, birthday=None):
+        self.name = LegacyField(name)
+        self.phones = [LegacyField(p) for p in phones]
+        self.birthday = LegacyField(birthday) if birthday else None
+
+
+class LegacyAddressBook(UserDict):
+    pass
+
+
+def dump_legacy(book, filename):
+    """Пише pickle так, як його писала стара версія з класами assistant.models."""
+    legacy_classes = {
+        "Field": LegacyField,
+        "Record": LegacyRecord,
+        "AddressBook": LegacyAddressBook,
+    }
+    for name, cls in legacy_classes.items():
+        cls.__module__ = "assistant.models"
+        cls.__qualname__ = name
+    with mock.patch.multiple(models, **legacy_classes):
+        with open(filename, "wb") as f:
+            pickle.dump(book, f)
+
+
+class StorageTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = os.path.join(self.tmp.name, "addressbook.json")
+        self.legacy_db = os.path.join(self.tmp.name, "addressbook.pkl")
+
+    def test_round_trip(self):
+        book = models.AddressBook()
+        record = models.Record("Ann")
+        record.add_phone("1234567890")
+        record.add_birthday("18.10.1990")
+        book.add_record(record)
+        save_data(book, self.db)
+        self.assertEqual(load_data(self.db).to_dict(), book.to_dict())
+
+    def test_missing_file_gives_empty_book(self):
+        self.assertEqual(len(load_data(self.db)), 0)
+
+    def test_legacy_pickle_is_migrated(self):
+        legacy = LegacyAddressBook()
+        legacy["Ann"] = LegacyRecord(
+            "Ann", ["1234567890", "1234567890"], date(1990, 10, 18)
+        )
+        legacy["Bob"] = LegacyRecord("Bob", ["2222222222"])
+        legacy["Bob"].addresses = [LegacyField("Kyiv")]
+        dump_legacy(legacy, self.legacy_db)
+
+        book = load_data(self.db)
+        self.assertEqual(
+            book.to_dict(),
+            {
+                "Ann": {
+                    "phones": ["1234567890"],
+                    "birthday": "18.10.1990",
+                    "addresses": [],
+                },
+                "Bob": {
+                    "phones": ["2222222222"],
+                    "birthday": None,
+                    "addresses": ["Kyiv"],
+                },
+            },
+        )
+
+    def test_legacy_pickle_rejects_foreign_globals(self):
+        with open(self.legacy_db, "wb") as f:
+            pickle.dump(os.getcwd, f)
+        with self.assertRaises(pickle.UnpicklingError):
+            load_data(self.db)
+
+
+if __name__ == "__main__":
+    unittest.main()